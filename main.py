@@ -20,7 +20,8 @@ FUNCIONALIDADES
 3. Ver registros (READ).
 4. Actualizar el nombre de un registro (UPDATE).
 5. Eliminar un registro (DELETE).
-6. Salir del programa.
+6. Cargar alumnos en bloque desde un archivo CSV.
+7. Salir del programa.
 
 -------------------------------------------------------------
 FLUJO DE LA APLICACIÓN
@@ -28,7 +29,7 @@ FLUJO DE LA APLICACIÓN
 1. El usuario ejecuta en la terminal:
        python cli_app.py
 2. El programa muestra un MENÚ PRINCIPAL en la consola.
-3. El usuario elige una opción (1-6).
+3. El usuario elige una opción (1-7).
 4. Según la opción seleccionada:
    - Se llama a una función que maneja la operación CRUD (Create, Read, Update, Delete).
    - La función se conecta a la base de datos 'alumnos_cli.db'
@@ -37,7 +38,7 @@ FLUJO DE LA APLICACIÓN
      (CREATE TABLE, INSERT, SELECT, UPDATE, DELETE).
 5. El programa muestra en pantalla el resultado de la operación.
 6. El menú vuelve a aparecer para permitir más operaciones.
-7. Cuando el usuario elige "6) Salir", el programa finaliza.
+7. Cuando el usuario elige "7) Salir", el programa finaliza.
 
 -------------------------------------------------------------
 ¡A PROGRAMAR!
@@ -52,10 +53,121 @@ Fecha: 2025
 
 import sqlite3  # Librería estándar de Python para usar bases de datos SQLite
 import os  # Para gestionar archivos (por si quisieras eliminar o comprobar la existencia del .db)
+import atexit  # Para cerrar la conexión compartida al terminar el programa
+import csv  # Para la carga masiva de alumnos desde un archivo CSV
+import sys  # Para escribir listados completos a stdout en una sola llamada
+import time  # Para la caducidad (TTL) de la caché de resultados
 
 # Nombre del archivo de base de datos que crearemos/usaremos
 DB_NAME = "alumnos_cli.db"
 
+# Sentencias SQL del CRUD, definidas UNA sola vez a nivel de módulo.
+# Al pasar siempre el mismo objeto string a cursor.execute, la caché
+# de sentencias preparadas de la conexión acierta en cada llamada y
+# SQLite no vuelve a parsear ni planificar la consulta.
+_SQL_INSERT = """
+    INSERT INTO alumnos (nombre, email, carrera)
+    VALUES (?, ?, ?);
+    """
+
+_SQL_SELECT_ALL = "SELECT id, nombre, email, carrera FROM alumnos;"
+
+_SQL_UPDATE_NAME = """
+    UPDATE alumnos
+    SET nombre = ?
+    WHERE id = ?;
+    """
+
+_SQL_DELETE = "DELETE FROM alumnos WHERE id = ?;"
+
+# Caché de resultados de lectura, en memoria del proceso.
+# Guarda las filas de cada consulta SELECT junto con el momento en que
+# se obtuvieron; mientras la entrada no caduque (_CACHE_TTL) ni haya
+# escrituras sobre 'alumnos', repetir la consulta desde el menú es un
+# simple acceso a diccionario en lugar de un viaje a la base de datos.
+_RESULT_CACHE = {}
+_CACHE_TTL = 5.0  # Segundos de validez de un resultado cacheado
+
+
+def _cache_get(sql: str):
+    """Devuelve las filas cacheadas para 'sql' si siguen vigentes, o None."""
+    entrada = _RESULT_CACHE.get(sql)
+    if entrada is None:
+        return None
+    guardado, filas = entrada
+    if time.monotonic() - guardado > _CACHE_TTL:
+        del _RESULT_CACHE[sql]
+        return None
+    return filas
+
+
+def _cache_put(sql: str, filas) -> None:
+    """Guarda las filas de 'sql' en la caché con su marca de tiempo."""
+    _RESULT_CACHE[sql] = (time.monotonic(), filas)
+
+
+def _invalidate_cache() -> None:
+    """Vacía la caché de resultados tras una escritura en 'alumnos'."""
+    _RESULT_CACHE.clear()
+
+
+# Prompts de captura de datos, definidos UNA vez a nivel de módulo para
+# que los literales no se reconstruyan en cada llamada interactiva.
+_FIELDS_ALUMNO = ("  🏷️ Nombre: ", "  📧 Email: ", "  🎓 Carrera: ")
+
+
+def _prompt(fields):
+    """Lee de consola una respuesta por cada prompt de 'fields', en orden."""
+    return [input(p) for p in fields]
+
+# Conexión compartida a la base de datos (se crea una sola vez).
+# Abrir y cerrar la conexión en cada operación obliga a SQLite a
+# releer el esquema y reabrir los archivos .db en cada llamada.
+_CONN = None
+
+
+def get_conn(db_path: str) -> sqlite3.Connection:
+    """
+    Devuelve la conexión compartida a la base de datos,
+    creándola la primera vez que se necesita.
+
+    Parámetros:
+    -----------
+    db_path : str
+        Ruta o nombre del archivo de la base de datos SQLite.
+
+    ¿Qué hace?
+    -----------
+    1. Si todavía no hay conexión, la abre y la guarda en _CONN.
+    2. Aplica PRAGMAs de rendimiento (modo WAL, sincronización
+       NORMAL, temporales en memoria y caché de páginas más grande).
+    3. Registra con atexit el cierre automático al salir del programa.
+    4. En llamadas siguientes, devuelve la misma conexión ya abierta.
+
+    Así evitamos reabrir el archivo .db en cada operación del menú,
+    y cada INSERT/UPDATE/DELETE escribe un solo frame en el WAL en
+    lugar de un journal de rollback completo con varios fsync.
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(
+            db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        _CONN.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+            """
+        )
+        atexit.register(_CONN.close)
+    return _CONN
+
 
 def create_database_and_table(db_path: str) -> None:
     """
@@ -68,34 +180,34 @@ def create_database_and_table(db_path: str) -> None:
 
     ¿Qué hace?
     -----------
-    1. Se conecta (o crea) la base de datos db_path.
+    1. Se conecta (o crea) la base de datos db_path; la conexión
+       compartida ya aplica los PRAGMAs de rendimiento al abrirse.
     2. Crea una tabla 'alumnos' con columnas:
        - id (PRIMARY KEY, autoincremental)
        - nombre (texto obligatorio)
        - email (texto obligatorio)
        - carrera (texto opcional)
     3. Si la tabla ya existe, no pasa nada.
-    4. Cierra la conexión.
+
+    Todo el script DDL viaja en UNA llamada a executescript, con su
+    propio BEGIN/COMMIT, en lugar de un execute + commit separados.
 
     ¡Listo para almacenar datos de nuestros alumnos!
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS alumnos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            email TEXT NOT NULL,
-            carrera TEXT
-        );
-        """
-        cursor.execute(create_table_query)
-        conn.commit()
-
-        cursor.close()
-        conn.close()
+        conn = get_conn(db_path)
+        conn.executescript(
+            """
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS alumnos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nombre TEXT NOT NULL,
+                email TEXT NOT NULL,
+                carrera TEXT
+            );
+            COMMIT;
+            """
+        )
         print("✅ [OK] Base de datos y tabla 'alumnos' creadas (o ya existen).")
     except Exception as e:
         print("❌ [ERROR] No se pudo crear la base de datos o la tabla:", e)
@@ -118,63 +230,142 @@ def insert_data(db_path: str) -> None:
        - Email
        - Carrera
     2. Inserta un nuevo registro en la tabla 'alumnos'.
-    3. Muestra un mensaje de confirmación o error.
+    3. Muestra el ID asignado (vía cursor.lastrowid, sin consultas
+       extra) junto con la confirmación, o el error si algo falló.
     """
-    conn = sqlite3.connect(db_path)
+    conn = get_conn(db_path)
     cursor = conn.cursor()
 
     print("\n👨‍🎓 Vamos a registrar un alumno. Por favor, ingresa los datos:")
-    nombre = input("  🏷️ Nombre: ")
-    email = input("  📧 Email: ")
-    carrera = input("  🎓 Carrera: ")
+    nombre, email, carrera = _prompt(_FIELDS_ALUMNO)
 
-    query = """
-    INSERT INTO alumnos (nombre, email, carrera)
-    VALUES (?, ?, ?);
-    """
     try:
-        cursor.execute(query, (nombre, email, carrera))
+        conn.execute("BEGIN IMMEDIATE")
+        cursor.execute(_SQL_INSERT, (nombre, email, carrera))
+        nuevo_id = cursor.lastrowid
         conn.commit()
-        print("✅ [INSERT] Registro insertado con éxito.")
+        _invalidate_cache()
+        print(f"✅ [INSERT] Registro insertado con éxito (ID={nuevo_id}).")
     except Exception as e:
         print("❌ [INSERT - ERROR]", e)
         conn.rollback()
     finally:
         cursor.close()
-        conn.close()
 
 
-def fetch_data(db_path: str) -> None:
+def insert_many(db_path: str, rows) -> int:
     """
-    Muestra todos los registros actuales en la tabla 'alumnos'.
+    Inserta varios alumnos de una sola vez, dentro de UNA transacción.
 
     Parámetros:
     -----------
     db_path : str
         Ruta o nombre del archivo de la base de datos SQLite.
+    rows : iterable
+        Secuencia de tuplas (nombre, email, carrera).
 
     ¿Qué hace?
     -----------
-    1. Ejecuta un SELECT para obtener todos los registros.
-    2. Imprime cada registro con sus valores (id, nombre, email, carrera).
-    3. Si no hay registros, informa que la tabla está vacía.
+    1. Abre una única transacción (BEGIN).
+    2. Inserta todas las filas con executemany.
+    3. Confirma con un solo COMMIT.
+
+    Insertar N filas con una transacción por fila cuesta un fsync
+    por registro; agrupándolas en una sola transacción el costo de
+    disco se paga UNA vez, sin importar cuántas filas sean.
+
+    Devuelve el número de filas insertadas.
     """
-    conn = sqlite3.connect(db_path)
+    conn = get_conn(db_path)
     cursor = conn.cursor()
 
-    query = "SELECT id, nombre, email, carrera FROM alumnos;"
-    cursor.execute(query)
-    rows = cursor.fetchall()
+    try:
+        conn.execute("BEGIN")
+        cursor.executemany(_SQL_INSERT, rows)
+        inserted = cursor.rowcount
+        conn.commit()
+        _invalidate_cache()
+        return inserted
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def insert_from_csv(db_path: str) -> None:
+    """
+    Carga alumnos en bloque desde un archivo CSV.
+
+    Parámetros:
+    -----------
+    db_path : str
+        Ruta o nombre del archivo de la base de datos SQLite.
+
+    ¿Qué hace?
+    -----------
+    1. Pide la ruta de un archivo CSV con columnas: nombre,email,carrera.
+    2. Lee todas las filas del archivo.
+    3. Las inserta todas juntas con insert_many (una sola transacción).
+    4. Informa cuántos alumnos se cargaron.
+    """
+    print("\n📂 Carga masiva desde CSV (columnas: nombre,email,carrera).")
+    csv_path = input("  Ingresa la ruta del archivo CSV: ")
+
+    if not os.path.exists(csv_path):
+        print(f"❌ [CSV - ERROR] No se encontró el archivo '{csv_path}'.")
+        return
+
+    try:
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = [(r[0], r[1], r[2] if len(r) > 2 else None) for r in csv.reader(f) if r]
+        inserted = insert_many(db_path, rows)
+        print(f"✅ [CSV] Se insertaron {inserted} alumnos desde '{csv_path}'.")
+    except Exception as e:
+        print("❌ [CSV - ERROR]", e)
+
+
+def fetch_data(db_path: str) -> None:
+    """
+    Muestra todos los registros actuales en la tabla 'alumnos'.
+
+    Parámetros:
+    -----------
+    db_path : str
+        Ruta o nombre del archivo de la base de datos SQLite.
+
+    ¿Qué hace?
+    -----------
+    1. Consulta primero la caché de resultados: si el mismo SELECT se
+       ejecutó hace menos de _CACHE_TTL segundos y no hubo escrituras,
+       reutiliza las filas guardadas sin tocar la base de datos.
+    2. Si no hay entrada vigente, ejecuta el SELECT, guarda las filas
+       en la caché y las muestra.
+    3. Arma el listado completo con str.join y lo escribe a stdout de
+       una sola vez: una llamada a write en lugar de un print por fila.
+    4. Si no hay registros, informa que la tabla está vacía.
+    """
+    rows = _cache_get(_SQL_SELECT_ALL)
+    if rows is None:
+        conn = get_conn(db_path)
+        cursor = conn.cursor()
+        cursor.execute(_SQL_SELECT_ALL)
+        rows = cursor.fetchall()
+        cursor.close()
+        _cache_put(_SQL_SELECT_ALL, rows)
 
     if rows:
-        print("\n📃 [READ] Registros en la tabla 'alumnos':")
-        for row in rows:
-            print(f"  🔑 ID: {row[0]} | 🏷️ Nombre: {row[1]} | 📧 Email: {row[2]} | 🎓 Carrera: {row[3]}")
+        sys.stdout.write(
+            "\n📃 [READ] Registros en la tabla 'alumnos':\n"
+            + "\n".join(
+                f"  🔑 ID: {r[0]} | 🏷️ Nombre: {r[1]} | 📧 Email: {r[2]} | 🎓 Carrera: {r[3]}"
+                for r in rows
+            )
+            + "\n"
+        )
     else:
         print("⚠️ [READ] No hay registros en la tabla.")
 
-    cursor.close()
-    conn.close()
     print()  # Salto de línea adicional para limpieza visual
 
 
@@ -189,26 +380,28 @@ def update_data(db_path: str) -> None:
 
     ¿Qué hace?
     -----------
-    1. Pide el ID del alumno a actualizar.
+    1. Pide el ID del alumno a actualizar y valida que sea un entero.
     2. Pide el nuevo nombre.
     3. Realiza un UPDATE en la tabla 'alumnos' para ese ID.
     4. Si el ID no existe, lo notifica.
     """
-    conn = sqlite3.connect(db_path)
+    conn = get_conn(db_path)
     cursor = conn.cursor()
 
     print("\n🔄 Vamos a actualizar un alumno.")
     alumno_id = input("  Ingresa el ID del alumno a actualizar: ")
+    try:
+        alumno_id = int(alumno_id)
+    except ValueError:
+        print(f"❌ [UPDATE - ERROR] El ID debe ser un número entero, no '{alumno_id}'.")
+        cursor.close()
+        return
     nuevo_nombre = input("  Ingresa el nuevo nombre: ")
 
-    query = """
-    UPDATE alumnos
-    SET nombre = ?
-    WHERE id = ?;
-    """
     try:
-        cursor.execute(query, (nuevo_nombre, alumno_id))
+        cursor.execute(_SQL_UPDATE_NAME, (nuevo_nombre, alumno_id))
         conn.commit()
+        _invalidate_cache()
         if cursor.rowcount > 0:
             print(f"✅ [UPDATE] El alumno con ID={alumno_id} ahora se llama '{nuevo_nombre}'.")
         else:
@@ -218,7 +411,6 @@ def update_data(db_path: str) -> None:
         conn.rollback()
     finally:
         cursor.close()
-        conn.close()
 
 
 def delete_data(db_path: str) -> None:
@@ -232,20 +424,26 @@ def delete_data(db_path: str) -> None:
 
     ¿Qué hace?
     -----------
-    1. Pide el ID del alumno a eliminar.
+    1. Pide el ID del alumno a eliminar y valida que sea un entero.
     2. Realiza un DELETE sobre la tabla 'alumnos' para ese ID.
     3. Notifica si el alumno se eliminó o si no existía.
     """
-    conn = sqlite3.connect(db_path)
+    conn = get_conn(db_path)
     cursor = conn.cursor()
 
     print("\n🗑️ Vamos a eliminar un alumno de la BD.")
     alumno_id = input("  Ingresa el ID del alumno a eliminar: ")
+    try:
+        alumno_id = int(alumno_id)
+    except ValueError:
+        print(f"❌ [DELETE - ERROR] El ID debe ser un número entero, no '{alumno_id}'.")
+        cursor.close()
+        return
 
-    query = "DELETE FROM alumnos WHERE id = ?;"
     try:
-        cursor.execute(query, (alumno_id,))
+        cursor.execute(_SQL_DELETE, (alumno_id,))
         conn.commit()
+        _invalidate_cache()
         if cursor.rowcount > 0:
             print(f"✅ [DELETE] Alumno con ID={alumno_id} eliminado correctamente.")
         else:
@@ -255,7 +453,36 @@ def delete_data(db_path: str) -> None:
         conn.rollback()
     finally:
         cursor.close()
-        conn.close()
+
+
+# Banner del menú principal, construido UNA vez a nivel de módulo.
+# Redibujarlo cuesta una sola llamada a write en lugar de diez print
+# (y diez syscalls) por cada vuelta del bucle.
+_MENU = (
+    "=================================\n"
+    "      📚 MENÚ PRINCIPAL 📚       \n"
+    "=================================\n"
+    "1) Crear base de datos y tabla\n"
+    "2) Insertar registro (CREATE)\n"
+    "3) Ver registros (READ)\n"
+    "4) Actualizar registro (UPDATE)\n"
+    "5) Eliminar registro (DELETE)\n"
+    "6) Cargar alumnos desde CSV\n"
+    "7) Salir\n"
+    "=================================\n"
+)
+
+# Tabla de despacho del menú: opción tecleada -> función que la atiende.
+# Un único acceso a diccionario reemplaza la cadena de comparaciones
+# if/elif; agregar una opción nueva es añadir una entrada aquí.
+_ACTIONS = {
+    "1": create_database_and_table,
+    "2": insert_data,
+    "3": fetch_data,
+    "4": update_data,
+    "5": delete_data,
+    "6": insert_from_csv,
+}
 
 
 def main_menu():
@@ -265,38 +492,24 @@ def main_menu():
 
     ¿Qué hace?
     -----------
-    1. Despliega un menú con opciones numeradas (1 a 6).
+    1. Despliega un menú con opciones numeradas (1 a 7).
     2. Espera que el usuario ingrese un número.
-    3. Llama a la función correspondiente según la elección.
-    4. Continúa hasta que el usuario elija la opción de salir (6).
+    3. Busca la opción en la tabla _ACTIONS y llama a la función
+       correspondiente (la opción 7, salir, corta el bucle).
+    4. Continúa hasta que el usuario elija la opción de salir (7).
     """
     while True:
-        print("=================================")
-        print("      📚 MENÚ PRINCIPAL 📚       ")
-        print("=================================")
-        print("1) Crear base de datos y tabla")
-        print("2) Insertar registro (CREATE)")
-        print("3) Ver registros (READ)")
-        print("4) Actualizar registro (UPDATE)")
-        print("5) Eliminar registro (DELETE)")
-        print("6) Salir")
-        print("=================================")
-
-        opcion = input("Elige una opción (1-6): ")
-
-        if opcion == "1":
-            create_database_and_table(DB_NAME)
-        elif opcion == "2":
-            insert_data(DB_NAME)
-        elif opcion == "3":
-            fetch_data(DB_NAME)
-        elif opcion == "4":
-            update_data(DB_NAME)
-        elif opcion == "5":
-            delete_data(DB_NAME)
-        elif opcion == "6":
+        sys.stdout.write(_MENU)
+
+        opcion = input("Elige una opción (1-7): ")
+
+        if opcion == "7":
             print("\n👋 Saliendo de la aplicación. ¡Hasta luego y sigue aprendiendo! 🚀")
             break
+
+        handler = _ACTIONS.get(opcion)
+        if handler is not None:
+            handler(DB_NAME)
         else:
             print("❌ [ERROR] Opción inválida. Intenta de nuevo.")
 